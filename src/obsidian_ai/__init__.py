@@ -1,12 +1,6 @@
-__all__ = ["__version__", "main"]
-
-try:
-    from importlib.metadata import version as _dist_version
+from ._version import __version__
 
-    __version__ = _dist_version("obsidian-ai")
-except Exception:
-    # Fallback for local, editable, or non-installed runs
-    __version__ = "0.1.1"
+__all__ = ["__version__", "main"]
 
 
 def main() -> None:
@@ -0,0 +1,7 @@
+"""Package version constant.
+
+Kept in sync with pyproject.toml; a literal avoids the importlib.metadata
+scan on every CLI startup.
+"""
+
+__version__ = "0.1.2"
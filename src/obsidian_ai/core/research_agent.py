@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import heapq
+from collections import defaultdict
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-from loguru import logger
-
-from ..core.search_engine import search_engine
 from ..core.wikilink_parser import WikiLinkParser
-from ..infrastructure.file_system import read_file_safe
-from ..services.openai_client import get_openai_client, OpenAIError
-from ..services.embedding_service import embedding_service
-from ..prompts.research import ResearchPrompts
+from ..infrastructure.file_system import read_file_cached
+
+# Heavy dependencies (loguru, OpenAI, the embedding stack) are imported inside
+# the methods that need them so importing this module stays cheap.
+
+# Labels in the model's reasoning response mapped to result fields
+_REASONING_FIELDS = {"REASONING": "reasoning", "ACTION": "action", "QUERY": "query"}
 
 
 @dataclass
@@ -31,6 +36,8 @@ class ResearchAgent:
     """Autonomous research agent that follows wikilinks and builds understanding iteratively."""
 
     def __init__(self) -> None:
+        from ..prompts.research import ResearchPrompts
+
         self.prompts = ResearchPrompts()
 
     def conduct_research(self, topic: str, max_iterations: int = 4) -> dict[str, Any]:
@@ -40,6 +47,8 @@ class ResearchAgent:
         Returns:
             Structured research results with steps, findings, and final report.
         """
+        from loguru import logger
+
         try:
             return self._execute_research(topic, max_iterations)
         except Exception as e:
@@ -48,6 +57,8 @@ class ResearchAgent:
 
     def _execute_research(self, topic: str, max_iterations: int) -> dict[str, Any]:
         """Execute the research process."""
+        from loguru import logger
+
         research_steps: list[ResearchStep] = []
         discovered_entities: set[str] = set()
         explored_queries: set[str] = set()
@@ -89,7 +100,7 @@ class ResearchAgent:
                     action=action_plan["action"],
                     query=action_plan["query"],
                     results=search_results,
-                    wikilinks_found=list(set(wikilinks_found)),
+                    wikilinks_found=wikilinks_found,
                     synthesis=synthesis,
                     next_actions=next_actions,
                 )
@@ -141,6 +152,10 @@ class ResearchAgent:
         self, topic: str, current_focus: str, previous_steps: list[ResearchStep], discovered_entities: set[str]
     ) -> dict[str, str]:
         """Plan the next research step using AI reasoning."""
+        from loguru import logger
+
+        from ..services.openai_client import OpenAIError, get_openai_client
+
         previous_context = ""
         if previous_steps:
             previous_context = "\n\n**Previous Research Steps:**\n"
@@ -149,14 +164,14 @@ class ResearchAgent:
 
         discovered_context = ""
         if discovered_entities:
-            discovered_context = f"\n\n**Entities Discovered So Far:** {', '.join(sorted(discovered_entities)[:10])}"
+            discovered_context = f"\n\n**Entities Discovered So Far:** {', '.join(heapq.nsmallest(10, discovered_entities))}"
 
         try:
             prompt = self.prompts.get_research_reasoning_prompt(
                 original_topic=topic, current_focus=current_focus, previous_context=previous_context, discovered_context=discovered_context
             )
 
-            response = get_openai_client().simple_completion(prompt, max_tokens=400)
+            response = get_openai_client().simple_completion(prompt, max_tokens=400, use_cache=True)
             return self._parse_reasoning_response(response)
 
         except OpenAIError as e:
@@ -165,23 +180,25 @@ class ResearchAgent:
 
     def _parse_reasoning_response(self, response: str) -> dict[str, str]:
         """Parse the AI's reasoning response."""
-        lines = response.split("\n")
         result = {"reasoning": "", "action": "search", "query": ""}
 
-        for line in lines:
-            if line.startswith("REASONING:"):
-                result["reasoning"] = line.replace("REASONING:", "").strip()
-            elif line.startswith("ACTION:"):
-                result["action"] = line.replace("ACTION:", "").strip()
-            elif line.startswith("QUERY:"):
-                result["query"] = line.replace("QUERY:", "").strip()
+        for line in response.split("\n"):
+            prefix, _, value = line.partition(":")
+            field = _REASONING_FIELDS.get(prefix.strip().upper())
+            if field:
+                result[field] = value.strip()
 
         return result
 
     def _execute_search(self, action_plan: dict[str, str]) -> tuple[list[dict], list[str]]:
         """Execute the planned search and extract wikilinks."""
+        from loguru import logger
+
+        from ..core.search_engine import search_engine
+        from ..services.embedding_service import embedding_service
+
         search_results = []
-        wikilinks_found = []
+        wikilinks_found: dict[str, None] = {}
 
         try:
             if action_plan["action"] == "search":
@@ -194,37 +211,45 @@ class ResearchAgent:
                 semantic_data = embedding_service.semantic_search(action_plan["query"], k=8)
                 search_results = semantic_data.get("results", [])
 
-            # Extract wikilinks from all found content
+            # Extract wikilinks from all found content, deduplicating as we
+            # go; insertion order keeps the list stable across runs
             for result in search_results:
                 content = result.get("text", result.get("preview", ""))
-                links = WikiLinkParser.extract_unique_targets(str(content))
-                wikilinks_found.extend(links)
+                wikilinks_found.update(dict.fromkeys(WikiLinkParser.extract_unique_targets(str(content))))
 
         except Exception as e:
             logger.error(f"Search execution failed: {e}")
 
-        return search_results, wikilinks_found
+        return search_results, list(wikilinks_found)
 
     def _analyze_relevant_files(self, topic: str, search_results: list[dict]) -> str:
         """Analyze the most relevant files for deeper insights."""
-        relevant_files = self._identify_relevant_files(search_results)
-        analysis_parts = []
+        from loguru import logger
+
+        relevant_files = self._identify_relevant_files(search_results, limit=3)
+        if not relevant_files:
+            return ""
 
-        for file_path in relevant_files[:3]:  # Limit to top 3 files
+        def analyze_one(file_path: str) -> str | None:
             try:
-                content = read_file_safe(file_path, max_bytes=16384)
+                content = read_file_cached(file_path, max_chars=16384)
                 analysis = self._analyze_file_content(topic, file_path, content[:2000])
-                analysis_parts.append(f"**Analysis of {file_path}:**\n{analysis}")
+                return f"**Analysis of {file_path}:**\n{analysis}"
 
             except Exception as e:
                 logger.warning(f"Could not analyze file {file_path}: {e}")
-                continue
+                return None
+
+        # Each analysis is an independent LLM round-trip; overlap them instead
+        # of paying the network latency three times sequentially.
+        with ThreadPoolExecutor(max_workers=len(relevant_files)) as executor:
+            analysis_parts = [part for part in executor.map(analyze_one, relevant_files) if part is not None]
 
         return "\n\n".join(analysis_parts)
 
-    def _identify_relevant_files(self, search_results: list[dict]) -> list[str]:
-        """Identify files most relevant for deeper analysis."""
-        file_scores = {}
+    def _identify_relevant_files(self, search_results: list[dict], limit: int = 3) -> list[str]:
+        """Identify the files most relevant for deeper analysis."""
+        file_scores: dict[str, float] = defaultdict(float)
 
         for result in search_results:
             path = result.get("path", "")
@@ -234,20 +259,21 @@ class ResearchAgent:
                 score = len(text) + text.lower().count("[[") * 10
                 score += result.get("score", 1.0) * 5  # Boost by search relevance
 
-                if path not in file_scores:
-                    file_scores[path] = 0
                 file_scores[path] += score
 
-        # Return files sorted by relevance score
-        sorted_files = sorted(file_scores.items(), key=lambda x: x[1], reverse=True)
-        return [path for path, _ in sorted_files]
+        # Return the top files by relevance score
+        return [path for path, _ in heapq.nlargest(limit, file_scores.items(), key=lambda kv: kv[1])]
 
     def _analyze_file_content(self, topic: str, file_path: str, content: str) -> str:
         """Analyze how relevant a file's content is to the research topic."""
+        from loguru import logger
+
+        from ..services.openai_client import OpenAIError, get_openai_client
+
         try:
             prompt = self.prompts.get_content_analysis_prompt(topic=topic, file_path=file_path, content=content)
 
-            return get_openai_client().simple_completion(prompt, max_tokens=200)
+            return get_openai_client().simple_completion(prompt, max_tokens=200, use_cache=True)
 
         except OpenAIError as e:
             logger.error(f"Content analysis failed for {file_path}: {e}")
@@ -257,6 +283,10 @@ class ResearchAgent:
         self, topic: str, action_plan: dict, search_results: list, wikilinks: list, content_analysis: str, previous_steps: list[ResearchStep]
     ) -> str:
         """Synthesize findings from this research step."""
+        from loguru import logger
+
+        from ..services.openai_client import OpenAIError, get_openai_client
+
         results_summary = f"Found {len(search_results)} results from {action_plan['action']}('{action_plan['query']}')"
         if search_results:
             results_summary += ":\n" + "\n".join(
@@ -279,7 +309,7 @@ class ResearchAgent:
                 previous_context=previous_context,
             )
 
-            return get_openai_client().simple_completion(prompt, max_tokens=400)
+            return get_openai_client().simple_completion(prompt, max_tokens=400, use_cache=True)
 
         except OpenAIError as e:
             logger.error(f"Synthesis failed: {e}")
@@ -287,6 +317,8 @@ class ResearchAgent:
 
     def _determine_next_actions(self, topic: str, synthesis: str, discovered_entities: set[str], explored_queries: set[str]) -> list[str]:
         """Determine next research actions based on findings."""
+        from ..services.openai_client import OpenAIError, get_openai_client
+
         unexplored_entities = [entity for entity in discovered_entities if entity.lower() not in explored_queries and len(entity) > 2]
 
         try:
@@ -307,7 +339,7 @@ Consider:
 
 Return 2-3 specific research directions, each as a short phrase or entity name."""
 
-            response = get_openai_client().simple_completion(prompt, max_tokens=200)
+            response = get_openai_client().simple_completion(prompt, max_tokens=200, use_cache=True)
             next_actions = [action.strip("- ").strip() for action in response.strip().split("\n") if action.strip()]
             return next_actions[:3]
 
@@ -316,6 +348,8 @@ Return 2-3 specific research directions, each as a short phrase or entity name."
 
     def _generate_alternative_query(self, topic: str, explored_queries: set[str], previous_steps: list[ResearchStep]) -> str:
         """Generate alternative query when the planned one was already explored."""
+        from ..services.openai_client import OpenAIError, get_openai_client
+
         recent_findings = ""
         if previous_steps:
             recent_findings = previous_steps[-1].synthesis
@@ -331,7 +365,7 @@ Focus on a different angle or aspect that hasn't been covered yet.
 
 Return only the search query:"""
 
-            return get_openai_client().simple_completion(prompt, max_tokens=50).strip()
+            return get_openai_client().simple_completion(prompt, max_tokens=50, use_cache=True).strip()
 
         except OpenAIError:
             return f"information about {topic}"
@@ -350,12 +384,14 @@ Return only the search query:"""
 
     def _generate_final_report(self, topic: str, research_steps: list[ResearchStep], discovered_entities: set[str]) -> str:
         """Generate comprehensive final research report."""
+        from loguru import logger
+
+        from ..services.openai_client import OpenAIError, get_openai_client
+
         all_syntheses = "\n\n".join([f"**Step {step.step_number}:** {step.synthesis}" for step in research_steps])
 
-        all_wikilinks = []
-        for step in research_steps:
-            all_wikilinks.extend(step.wikilinks_found)
-        unique_wikilinks = list(set(all_wikilinks))
+        # Dedupe in discovery order so repeat runs build identical prompts
+        unique_wikilinks = list(dict.fromkeys(chain.from_iterable(step.wikilinks_found for step in research_steps)))
 
         try:
             prompt = self.prompts.get_final_report_prompt(
@@ -365,7 +401,7 @@ Return only the search query:"""
                 unique_wikilinks=", ".join(unique_wikilinks[:20]),
             )
 
-            return get_openai_client().simple_completion(prompt, max_tokens=1000)
+            return get_openai_client().simple_completion(prompt, max_tokens=1000, use_cache=True)
 
         except OpenAIError as e:
             logger.error(f"Final report generation failed: {e}")
@@ -384,5 +420,7 @@ Return only the search query:"""
         }
 
 
-# Global research agent instance
-research_agent = ResearchAgent()
+@lru_cache(maxsize=1)
+def get_research_agent() -> ResearchAgent:
+    """Get the global research agent instance."""
+    return ResearchAgent()
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import json
+import os
 import re
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Protocol
 
 from ..infrastructure.config import config
-from ..infrastructure.file_system import iter_text_files
+from ..infrastructure.file_system import iter_text_files, mmap_text, read_text_cached
+from ..infrastructure.keyword_index import INDEXABLE_KEYWORD, get_keyword_index
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     """A single search result."""
 
@@ -19,125 +23,266 @@ class SearchResult:
     text: str
     brain_dir: Path
     score: float = 1.0
+    # Computed once at construction; slots drop the per-instance __dict__,
+    # which adds up when a broad query produces thousands of results
+    _relative: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_relative", os.path.relpath(self.path, self.brain_dir))
 
     @property
     def relative_path(self) -> str:
-        return str(Path(self.path).relative_to(self.brain_dir))
+        return self._relative
 
 
 class SearchStrategy(Protocol):
     """Protocol for search strategies."""
 
+    # Strategies that rank results globally need to see every file before
+    # the engine can trim to a result limit.
+    needs_full_scan: bool
+
     def search(self, query: str, max_results: int) -> list[SearchResult]:
-        """Execute the search strategy."""
+        """Execute the search strategy over the whole vault."""
+        ...
+
+    def score_file(self, query: str, path: Path, text: str | None) -> list[SearchResult]:
+        """Score a single decoded file against the query."""
         ...
 
 
+def _read_text(path: Path) -> str | None:
+    """Decode a file as UTF-8, returning None if it cannot be read."""
+    return read_text_cached(path)
+
+
+def _probe_hits(path: Path, probe: re.Pattern[bytes] | None) -> bool:
+    """Scan a file's raw bytes for the probe without decoding it.
+
+    Runs over an mmap, so rejected files are never copied into a Python
+    buffer. Files that cannot be mapped report a hit so the caller falls
+    back to the decoded path.
+    """
+    if probe is None:
+        return True
+    mapped = mmap_text(path)
+    if mapped is None:
+        return True
+    try:
+        return probe.search(mapped) is not None
+    finally:
+        mapped.close()
+
+
+@lru_cache(maxsize=64)
+def _phrase_probe(query: str) -> re.Pattern[bytes] | None:
+    """Byte-mode pattern for the exact phrase; None when bytes cannot decide."""
+    try:
+        needle = query.strip().lower().encode("ascii")
+    except UnicodeEncodeError:
+        return None
+    if not needle:
+        return None
+    return re.compile(re.escape(needle), re.IGNORECASE)
+
+
 class ExactPhraseSearch:
     """Search for exact phrases with case insensitive matching."""
 
-    def search(self, query: str, max_results: int) -> list[SearchResult]:
-        if not query.strip():
-            return []
+    needs_full_scan = False
 
-        pattern = re.compile(re.escape(query.strip()), re.IGNORECASE)
+    def search(self, query: str, max_results: int) -> list[SearchResult]:
         results: list[SearchResult] = []
+        probe = _phrase_probe(query)
 
         for path in iter_text_files(config.brain_dir, config.ignore_patterns):
             if len(results) >= max_results:
                 break
-
-            try:
-                text = path.read_text(encoding="utf-8", errors="ignore")
-                lines = text.splitlines()
-
-                for line_num, line in enumerate(lines, 1):
-                    if pattern.search(line):
-                        # Get context around the match
-                        context_lines = []
-                        for i in range(max(0, line_num - 2), min(len(lines), line_num + 2)):
-                            context_lines.append(lines[i].strip())
-                        context = " | ".join(context_lines)
-
-                        results.append(
-                            SearchResult(
-                                path=str(path),
-                                line=line_num,
-                                text=context[:300],
-                                brain_dir=config.brain_dir,
-                                score=2.0,  # Higher score for exact matches
-                            )
-                        )
-                        break
-            except Exception:
+            # Byte-level rejection over the mmap; only hits pay for a decode
+            if not _probe_hits(path, probe):
                 continue
+            results.extend(self.score_file(query, path, _read_text(path)))
 
         return results
 
+    def score_file(self, query: str, path: Path, text: str | None) -> list[SearchResult]:
+        if text is None or not query.strip():
+            return []
+
+        pattern = re.compile(re.escape(query.strip()), re.IGNORECASE)
+
+        # Single C-level scan over the whole file; most files have no
+        # match, so skip them without ever materializing a line list.
+        match = pattern.search(text)
+        if not match:
+            return []
+
+        line_num = text.count("\n", 0, match.start()) + 1
+
+        # Context is the matched line plus its neighbours, sliced between
+        # newline anchors so the rest of the file is never split
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        region_start = text.rfind("\n", 0, line_start - 1) + 1 if line_start else 0
+        region_end = line_start
+        for _ in range(3):  # end of the matched line and the two after it
+            newline = text.find("\n", region_end)
+            if newline < 0:
+                region_end = len(text)
+                break
+            region_end = newline + 1
+        context = " | ".join(line.strip() for line in text[region_start:region_end].splitlines())
+
+        return [
+            SearchResult(
+                path=str(path),
+                line=line_num,
+                text=context[:300],
+                brain_dir=config.brain_dir,
+                score=2.0,  # Higher score for exact matches
+            )
+        ]
+
+
+def _line_at(text: str, pos: int) -> tuple[int, str]:
+    """Line number and stripped line text at a byte offset."""
+    line_num = text.count("\n", 0, pos) + 1
+    line_start = text.rfind("\n", 0, pos) + 1
+    line_end = text.find("\n", pos)
+    if line_end < 0:
+        line_end = len(text)
+    return line_num, text[line_start:line_end].strip()
+
 
 class KeywordSearch:
     """Search for individual keywords with scoring."""
 
+    needs_full_scan = True
+
     def search(self, query: str, max_results: int) -> list[SearchResult]:
         keywords = [k.strip().lower() for k in query.split() if len(k.strip()) > 2]
         if not keywords:
             return []
 
-        results: list[tuple[SearchResult, int]] = []  # (result, score)
-
-        for path in iter_text_files(config.brain_dir, config.ignore_patterns):
-            try:
-                text = path.read_text(encoding="utf-8", errors="ignore")
-                lines = text.splitlines()
-
-                for line_num, line in enumerate(lines, 1):
-                    line_lower = line.lower()
-                    score = sum(1 for keyword in keywords if keyword in line_lower)
-
-                    if score > 0:
-                        results.append(
-                            (SearchResult(path=str(path), line=line_num, text=line.strip()[:200], brain_dir=config.brain_dir, score=score), score)
-                        )
-            except Exception:
+        paths = list(iter_text_files(config.brain_dir, config.ignore_patterns))
+
+        # Word-character keywords are answered from the inverted index:
+        # scoring becomes a vocabulary scan and only the top files are read
+        # back for their snippets. Keywords with other characters could
+        # straddle token boundaries, so they take the scan path.
+        if all(INDEXABLE_KEYWORD.fullmatch(keyword) for keyword in keywords):
+            index = get_keyword_index()
+            index.refresh(config.brain_dir, paths)
+            scored = index.lookup(keywords)
+            scored.sort(key=lambda item: item[1], reverse=True)
+
+            results = []
+            for path_str, score, first_pos in scored[:max_results]:
+                text = _read_text(Path(path_str))
+                if text is None:
+                    continue
+                line_num, line = _line_at(text, first_pos)
+                results.append(SearchResult(path=path_str, line=line_num, text=line[:200], brain_dir=config.brain_dir, score=score))
+            return results
+
+        probe = _byte_probe(query)
+        results = []
+        for path in paths:
+            # No keyword in the raw bytes means no score; skip the decode
+            if not _probe_hits(path, probe):
                 continue
+            results.extend(self.score_file(query, path, _read_text(path)))
 
         # Sort by score and return top results
-        results.sort(key=lambda x: x[1], reverse=True)
-        return [result for result, _ in results[:max_results]]
+        results.sort(key=lambda r: r.score, reverse=True)
+        return results[:max_results]
+
+    def score_file(self, query: str, path: Path, text: str | None) -> list[SearchResult]:
+        keywords = [k.strip().lower() for k in query.split() if len(k.strip()) > 2]
+        if not keywords or text is None:
+            return []
+
+        # Lowercase the whole buffer once, then aggregate per file with one
+        # C-level count per keyword instead of a Python loop over every line.
+        text_lower = text.lower()
+        score = 0
+        first_pos = -1
+        for keyword in keywords:
+            pos = text_lower.find(keyword)
+            if pos < 0:
+                continue
+            score += text_lower.count(keyword, pos)
+            if first_pos < 0 or pos < first_pos:
+                first_pos = pos
+
+        if score == 0:
+            return []
+
+        # Snippet is the line containing the earliest keyword hit
+        line_num, line = _line_at(text, first_pos)
+        snippet = line[:200]
+
+        return [SearchResult(path=str(path), line=line_num, text=snippet, brain_dir=config.brain_dir, score=score)]
+
+
+@lru_cache(maxsize=64)
+def _filename_pattern(query: str) -> re.Pattern[str] | None:
+    """Alternation regex over query keywords, compiled once per query."""
+    keywords = query.lower().split()
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
 
 
 class FilenameSearch:
     """Search filenames for partial matches."""
 
+    needs_full_scan = False
+
     def search(self, query: str, max_results: int) -> list[SearchResult]:
-        query_lower = query.lower()
-        keywords = query_lower.split()
         results: list[SearchResult] = []
 
         for path in iter_text_files(config.brain_dir, config.ignore_patterns):
-            filename_lower = path.name.lower()
-
-            if any(keyword in filename_lower for keyword in keywords):
-                try:
-                    text = path.read_text(encoding="utf-8", errors="ignore")
-                    first_lines = "\n".join(text.splitlines()[:3])
-                    results.append(
-                        SearchResult(
-                            path=str(path),
-                            line=1,
-                            text=f"📁 {path.name}: {first_lines[:150]}",
-                            brain_dir=config.brain_dir,
-                            score=1.5,  # Medium score for filename matches
-                        )
-                    )
-                except Exception:
-                    results.append(SearchResult(path=str(path), line=1, text=f"📁 {path.name}", brain_dir=config.brain_dir, score=1.0))
-
+            results.extend(self.score_file(query, path, _read_text(path)))
             if len(results) >= max_results:
                 break
 
         return results
 
+    def score_file(self, query: str, path: Path, text: str | None) -> list[SearchResult]:
+        pattern = _filename_pattern(query)
+
+        # One scan of the filename instead of a substring test per keyword
+        if pattern is None or not pattern.search(path.name.lower()):
+            return []
+
+        if text is not None:
+            first_lines = "\n".join(text.splitlines()[:3])
+            return [
+                SearchResult(
+                    path=str(path),
+                    line=1,
+                    text=f"📁 {path.name}: {first_lines[:150]}",
+                    brain_dir=config.brain_dir,
+                    score=1.5,  # Medium score for filename matches
+                )
+            ]
+        return [SearchResult(path=str(path), line=1, text=f"📁 {path.name}", brain_dir=config.brain_dir, score=1.0)]
+
+
+@lru_cache(maxsize=64)
+def _byte_probe(query: str) -> re.Pattern[bytes] | None:
+    """Byte-mode alternation over the query's ASCII needles; None disables the prefilter."""
+    try:
+        data = query.strip().lower().encode("ascii")
+    except UnicodeEncodeError:
+        return None
+
+    needles = [data] if data else []
+    needles.extend(word for word in data.split() if len(word) > 2 and word != data)
+    if not needles:
+        return None
+    return re.compile(b"|".join(re.escape(needle) for needle in needles), re.IGNORECASE)
+
 
 class UnifiedSearchEngine:
     """Unified search engine that combines multiple search strategies."""
@@ -146,16 +291,49 @@ class UnifiedSearchEngine:
         self.strategies: list[SearchStrategy] = [ExactPhraseSearch(), KeywordSearch(), FilenameSearch()]
 
     def search(self, query: str, max_results: int = 10) -> list[SearchResult]:
-        """Execute multi-strategy search and combine results."""
+        """Execute multi-strategy search over a single pass of the vault."""
+        per_strategy_limit = max_results // 2
+        strategy_results: list[list[SearchResult]] = [[] for _ in self.strategies]
+
+        probe = _byte_probe(query)
+        query_words = query.lower().split()
+
+        def score_one(path: Path) -> list[list[SearchResult]] | None:
+            """Read and decode one file once and score it with every strategy."""
+            # Byte-level rejection: if no needle appears in the raw bytes and
+            # the filename cannot match either, skip the UTF-8 decode entirely.
+            # The probe runs over an mmap, so rejected files are never copied
+            # into a Python buffer.
+            if probe is not None and not any(word in path.name.lower() for word in query_words):
+                mapped = mmap_text(path)
+                if mapped is not None:
+                    try:
+                        if probe.search(mapped) is None:
+                            return None
+                    finally:
+                        mapped.close()
+
+            text = _read_text(path)
+            return [strategy.score_file(query, path, text) for strategy in self.strategies]
+
+        # Reads release the GIL, so a thread pool overlaps the per-file I/O.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2)) as executor:
+            for file_results in executor.map(score_one, iter_text_files(config.brain_dir, config.ignore_patterns), chunksize=32):
+                if file_results is None:
+                    continue
+                for results, found in zip(strategy_results, file_results):
+                    results.extend(found)
+
+        # Merge per-strategy results with dedup by file and line
         all_results: list[SearchResult] = []
-        seen_lines: set[str] = set()
+        seen_lines: set[tuple[str, int]] = set()
 
-        # Execute each strategy
-        for strategy in self.strategies:
-            strategy_results = strategy.search(query, max_results // 2)
+        for strategy, results in zip(self.strategies, strategy_results):
+            if strategy.needs_full_scan:
+                results.sort(key=lambda r: r.score, reverse=True)
 
-            for result in strategy_results:
-                key = f"{result.path}:{result.line}"
+            for result in results[:per_strategy_limit]:
+                key = (result.path, result.line)
                 if key not in seen_lines:
                     all_results.append(result)
                     seen_lines.add(key)
@@ -174,7 +352,8 @@ class UnifiedSearchEngine:
                 "results": [{"path": result.relative_path, "line": result.line, "text": result.text, "score": result.score} for result in results],
                 "count": len(results),
                 "search_strategies": "exact_phrase, keywords, filename_matching",
-            }
+            },
+            separators=(",", ":"),
         )
 
 
@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import heapq
 import re
+from functools import lru_cache
 from typing import NamedTuple
 from collections.abc import Callable
 
+# Pattern to match [[content]]. The single bounded character class keeps
+# matching linear-time on malformed bracket runs; Obsidian link targets never
+# legitimately contain inner brackets or newlines. Compiled once at import
+# time so repeated extraction calls skip the regex-cache lookup.
+_WIKILINK_PATTERN = re.compile(r"\[\[([^\[\]\n]{1,256})\]\]")
+
+# Capture-free twin for existence/count checks, where allocating match
+# groups is pure overhead
+_WIKILINK_PROBE = re.compile(r"\[\[[^\[\]\n]{1,256}\]\]")
+
 
 class WikiLink(NamedTuple):
     """Represents a parsed wikilink."""
@@ -23,19 +35,7 @@ class WikiLinkParser:
     @staticmethod
     def extract_wikilinks(text: str) -> list[WikiLink]:
         """Extract all wikilinks from text."""
-        # Pattern to match [[content]] - handles nested brackets
-        pattern = r"\[\[([^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*)\]\]"
-        matches = re.findall(pattern, text)
-
-        wikilinks = []
-        for match in matches:
-            if "|" in match:
-                target, display = match.split("|", 1)
-                wikilinks.append(WikiLink(target.strip(), display.strip()))
-            else:
-                wikilinks.append(WikiLink(match.strip()))
-
-        return wikilinks
+        return list(_cached_wikilinks(text))
 
     @staticmethod
     def extract_link_targets(text: str) -> list[str]:
@@ -65,124 +65,70 @@ class WikiLinkParser:
 
             return replacement_func(wikilink, full_link)
 
-        pattern = r"\[\[([^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*)\]\]"
-        return re.sub(pattern, replace_match, text)
+        return _WIKILINK_PATTERN.sub(replace_match, text)
 
     @staticmethod
     def validate_wikilink(text: str) -> bool:
         """Check if text contains valid wikilink syntax."""
-        pattern = r"\[\[([^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*)\]\]"
-        return bool(re.search(pattern, text))
+        return _WIKILINK_PROBE.search(text) is not None
 
     @staticmethod
     def count_wikilinks(text: str) -> int:
         """Count the number of wikilinks in text."""
-        return len(WikiLinkParser.extract_wikilinks(text))
+        return sum(1 for _ in _WIKILINK_PROBE.finditer(text))
+
+
+# Research revisits the same note content across iterations; caching on the
+# text itself makes repeat extractions a dict lookup. Tuples keep the cached
+# values immutable so callers can't mutate a shared result.
+@lru_cache(maxsize=1024)
+def _cached_wikilinks(text: str) -> tuple[WikiLink, ...]:
+    wikilinks = []
+    for match in _WIKILINK_PATTERN.findall(text):
+        if "|" in match:
+            target, display = match.split("|", 1)
+            wikilinks.append(WikiLink(target.strip(), display.strip()))
+        else:
+            wikilinks.append(WikiLink(match.strip()))
+    return tuple(wikilinks)
+
+
+# One fused scan over a note: each match is a wikilink target, a capitalized
+# name phrase, or a plain 3+ letter word
+_KEYTERM_PATTERN = re.compile(r"\[\[([^\[\]\n]{1,256})\]\]|\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b|\b([a-zA-Z]{3,})\b")
+
+# Common English words filtered out of key-term extraction
+_COMMON_WORDS: frozenset[str] = frozenset({
+    "the", "and", "for", "are", "but", "not", "you", "all", "can", "had", "her", "was", "one", "our", "out", "day", "get", "has", "him", "his",
+    "how", "its", "new", "now", "old", "see", "two", "way", "who", "boy", "did", "may", "say", "she", "use", "your", "each", "make", "most",
+    "over", "said", "some", "time", "very", "what", "with", "have", "from", "they", "know", "want", "been", "good", "much", "more", "will", "well",
+    "where", "come", "could", "should", "would", "there", "their", "which", "about", "after", "first", "never", "these", "think", "other", "many",
+    "than", "then", "them", "before", "here", "this"
+})
 
 
 def extract_key_terms(content: str) -> list[str]:
     """Extract key terms from content for finding related notes."""
-    # Extract wiki-style links first (before removing brackets)
-    wiki_targets = WikiLinkParser.extract_unique_targets(content)
-
-    # Remove markdown formatting
-    content = re.sub(r"[#*`\[\]]+", "", content)
-
-    # Extract potential names (capitalized words including multi-word phrases)
-    names = re.findall(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b", content)
-
-    # Extract important phrases (3+ character words)
-    words = re.findall(r"\b[a-zA-Z]{3,}\b", content)
-
-    # Combine and deduplicate
-    key_terms = list(dict.fromkeys(wiki_targets + names + words))
-
-    # Filter out common words
-    common_words = {
-        "the",
-        "and",
-        "for",
-        "are",
-        "but",
-        "not",
-        "you",
-        "all",
-        "can",
-        "had",
-        "her",
-        "was",
-        "one",
-        "our",
-        "out",
-        "day",
-        "get",
-        "has",
-        "him",
-        "his",
-        "how",
-        "its",
-        "new",
-        "now",
-        "old",
-        "see",
-        "two",
-        "way",
-        "who",
-        "boy",
-        "did",
-        "may",
-        "say",
-        "she",
-        "use",
-        "your",
-        "each",
-        "make",
-        "most",
-        "over",
-        "said",
-        "some",
-        "time",
-        "very",
-        "what",
-        "with",
-        "have",
-        "from",
-        "they",
-        "know",
-        "want",
-        "been",
-        "good",
-        "much",
-        "more",
-        "will",
-        "well",
-        "where",
-        "come",
-        "could",
-        "should",
-        "would",
-        "there",
-        "their",
-        "which",
-        "about",
-        "after",
-        "first",
-        "never",
-        "these",
-        "think",
-        "other",
-        "many",
-        "than",
-        "then",
-        "them",
-        "before",
-        "here",
-        "this",
-    }
-
-    filtered_terms = [term for term in key_terms if term.lower() not in common_words and len(term) > 2]
-
-    # Sort by length (longer terms first, as they're likely more specific)
-    filtered_terms.sort(key=len, reverse=True)
-
-    return filtered_terms[:20]  # Return top 20 terms
+    return list(_cached_key_terms(content))
+
+
+@lru_cache(maxsize=1024)
+def _cached_key_terms(content: str) -> tuple[str, ...]:
+    # Single pass over the note instead of separate wikilink, markdown-strip,
+    # name, and word scans; insertion order doubles as deduplication
+    key_terms: dict[str, None] = {}
+    for match in _KEYTERM_PATTERN.finditer(content):
+        wikilink, name, word = match.group(1, 2, 3)
+        if wikilink is not None:
+            key_terms[wikilink.split("|", 1)[0].strip()] = None
+        elif name is not None:
+            key_terms[name] = None
+        else:
+            key_terms[word] = None
+
+    # Filter out common words; cheap length check first, one lower() per term
+    filtered_terms = [term for term in key_terms if len(term) > 2 and term.lower() not in _COMMON_WORDS]
+
+    # Top 20 terms by length (longer terms first, as they're likely more
+    # specific); nlargest avoids a full sort of every candidate term
+    return tuple(heapq.nlargest(20, filtered_terms, key=len))
@@ -4,13 +4,13 @@ from dataclasses import dataclass
 from functools import cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     brain_dir: Path
     model: str
     max_tool_calls: int
     cache_dir: Path
-    ignore_patterns: list[str]
+    ignore_patterns: tuple[str, ...]
 
     @classmethod
     @cache
@@ -31,7 +31,7 @@ class Config:
             model=os.getenv("OBSIDIAN_AI_MODEL", "gpt-4o"),
             max_tool_calls=int(os.getenv("OBSIDIAN_AI_MAX_TOOL_CALLS", "5")),
             cache_dir=brain_dir / ".obsidian_ai_cache",
-            ignore_patterns=default_ignores,
+            ignore_patterns=tuple(default_ignores),
         )
 
 
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from collections.abc import Sequence
+
+from .config import config
+
+# File types treated as notes; the tuple feeds str.endswith, which checks
+# all suffixes in one C call
+TEXT_SUFFIXES = {".md", ".txt", ".org", ".rst"}
+_TEXT_SUFFIX_TUPLE = tuple(TEXT_SUFFIXES)
+
+
+@lru_cache(maxsize=16)
+def _ignore_regex(ignore_patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """One alternation regex over all ignore patterns; None if there are none.
+
+    A single compiled search replaces a Python-level substring test per
+    pattern, so the per-entry cost stays flat as the ignore list grows.
+    """
+    if not ignore_patterns:
+        return None
+    return re.compile("|".join(re.escape(pattern) for pattern in ignore_patterns))
+
+
+def _dir_signature(brain_dir: Path, ignore_patterns: tuple[str, ...]) -> dict[str, int]:
+    """Map every non-ignored directory to its mtime_ns.
+
+    Directory mtimes change whenever entries are added, removed, or renamed,
+    so comparing them tells us whether the file listing is stale without
+    stat-ing every file in the vault.
+    """
+    ignore = _ignore_regex(ignore_patterns)
+    signature: dict[str, int] = {}
+    stack = [brain_dir]
+
+    while stack:
+        directory = stack.pop()
+        try:
+            signature[str(directory)] = directory.stat().st_mtime_ns
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) and (ignore is None or not ignore.search(entry.path)):
+                        stack.append(Path(entry.path))
+        except OSError:
+            continue
+
+    return signature
+
+
+def _walk_text_files(brain_dir: Path, ignore_patterns: tuple[str, ...]) -> list[Path]:
+    """Walk the vault and collect text files, respecting ignore patterns.
+
+    Ignored directories (.git, .obsidian, ...) are pruned at the directory
+    level, so their contents are never listed or stat-ed. scandir's cached
+    dirent type means the whole walk costs one syscall per directory.
+    """
+    ignore = _ignore_regex(ignore_patterns)
+    files = []
+    stack = [str(brain_dir)]
+
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if ignore is None or not ignore.search(entry.path):
+                            stack.append(entry.path)
+                    # Suffix test first: names that cannot be notes skip the
+                    # type and ignore checks entirely
+                    elif entry.name.lower().endswith(_TEXT_SUFFIX_TUPLE):
+                        if entry.is_file(follow_symlinks=False) and (ignore is None or not ignore.search(entry.path)):
+                            files.append(Path(entry.path))
+        except OSError:
+            continue
+
+    return files
+
+
+class FileIndex:
+    """Caches the vault's text-file listing between searches.
+
+    The listing is reused as long as the directory-mtime signature matches,
+    and persisted in the cache directory so a fresh process can skip the
+    initial walk too.
+    """
+
+    def __init__(self) -> None:
+        self._key: tuple[str, tuple[str, ...]] | None = None
+        self._signature: dict[str, int] | None = None
+        self._files: list[Path] | None = None
+
+    def list_files(self, brain_dir: Path, ignore_patterns: Sequence[str]) -> list[Path]:
+        """Return the text files under brain_dir, from cache when fresh."""
+        key = (str(brain_dir), tuple(ignore_patterns))
+        signature = _dir_signature(brain_dir, key[1])
+
+        if self._files is not None and self._key == key and self._signature == signature:
+            return self._files
+
+        if self._files is None:
+            cached = self._load(key)
+            if cached is not None and cached[0] == signature:
+                self._key, self._signature, self._files = key, signature, cached[1]
+                return self._files
+
+        self._key = key
+        self._signature = signature
+        self._files = _walk_text_files(brain_dir, key[1])
+        self._store(key, signature, self._files)
+        return self._files
+
+    def _index_file(self) -> Path:
+        return config.cache_dir / "file_index_v1.json"
+
+    def _load(self, key: tuple[str, tuple[str, ...]]) -> tuple[dict[str, int], list[Path]] | None:
+        try:
+            data = json.loads(self._index_file().read_text())
+            if data.get("key") != [key[0], list(key[1])]:
+                return None
+            return data["signature"], [Path(p) for p in data["files"]]
+        except Exception:
+            return None
+
+    def _store(self, key: tuple[str, tuple[str, ...]], signature: dict[str, int], files: list[Path]) -> None:
+        # Only persist listings of the configured vault; transient directories
+        # (tests, ad-hoc calls) stay in memory.
+        if key[0] != str(config.brain_dir):
+            return
+        try:
+            config.cache_dir.mkdir(parents=True, exist_ok=True)
+            payload = {"key": [key[0], list(key[1])], "signature": signature, "files": [str(p) for p in files]}
+            self._index_file().write_text(json.dumps(payload))
+        except Exception:
+            pass  # Persistence is best-effort; the in-memory cache still works
+
+
+@lru_cache(maxsize=1)
+def get_file_index() -> FileIndex:
+    """Get the global file index instance."""
+    return FileIndex()
@@ -1,51 +1,134 @@
 from __future__ import annotations
 
+import mmap
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, Sequence
 
 from .config import config
 
 
-def iter_text_files(brain_dir: Path, ignore_patterns: list[str] | None = None) -> Iterator[Path]:
+def iter_text_files(brain_dir: Path, ignore_patterns: Sequence[str] | None = None) -> Iterator[Path]:
     """Iterate over text files in brain directory, respecting ignore patterns."""
-    ignore_patterns = ignore_patterns or []
+    from .file_index import get_file_index
 
-    for path in brain_dir.rglob("*"):
-        if not path.is_file():
-            continue
+    yield from get_file_index().list_files(brain_dir, ignore_patterns or [])
 
-        # Check if file should be ignored
-        if any(pattern in str(path) for pattern in ignore_patterns):
-            continue
 
-        # Only include text files
-        if path.suffix.lower() in {".md", ".txt", ".org", ".rst"}:
-            yield path
+def read_all_text(paths: Iterable[Path], max_workers: int = 8) -> Iterator[tuple[Path, str]]:
+    """Read many files concurrently, yielding (path, text) as reads finish.
 
+    File reads release the GIL, so a small thread pool overlaps the
+    open/read syscalls. Completion order is not the input order; unreadable
+    files are skipped, as are files whose first KB contains a NUL byte —
+    binary data misnamed with a text suffix, not worth decoding.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(path.read_bytes): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                data = future.result()
+            except Exception:
+                continue
+            if b"\x00" in data[:1024]:
+                continue
+            yield futures[future], data.decode("utf-8", errors="ignore")
 
-def read_file_safe(path: str, start_byte: int = 0, max_bytes: int = 32768) -> str:
-    """Safely read a file with error handling."""
+
+def mmap_text(path: Path) -> mmap.mmap | None:
+    """Memory-map a file read-only; None for empty or unreadable files.
+
+    Scans that only probe the raw bytes (byte-mode regex, substring checks)
+    can run over the mapping without copying the file into a Python buffer.
+    """
+    try:
+        with path.open("rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _read_cached(path: str, mtime_ns: int) -> str:
+    """Read and decode a whole file, cached on path and modification time."""
+    return Path(path).read_text(encoding="utf-8", errors="ignore")
+
+
+def read_text_cached(path: Path) -> str | None:
+    """Decode a file as UTF-8 via the mtime-aware cache; None if unreadable."""
+    try:
+        return _read_cached(str(path), path.stat().st_mtime_ns)
+    except Exception:
+        return None
+
+
+def read_file_cached(path: str, max_chars: int = 32768) -> str:
+    """Read a file within the brain directory through the content cache.
+
+    Like read_file_safe but served from the whole-file cache, so repeated
+    reads of an unchanged file cost only a stat call.
+    """
+    try:
+        file_path = _resolve_path(path)
+        text = _read_cached(str(file_path), file_path.stat().st_mtime_ns)
+    except Exception as e:
+        raise ValueError(f"Cannot read {path}: {e}")
+    return text[:max_chars]
+
+
+@lru_cache(maxsize=4)
+def _resolved_root(brain_dir: str) -> Path:
+    """Resolve the brain directory once per configured value.
+
+    Path.resolve walks every path component with syscalls; keying on the
+    configured value keeps the cache correct if the config is swapped out.
+    """
+    return Path(brain_dir).resolve()
+
+
+def read_file_safe(path: str, start_byte: int = 0, max_bytes: int = 32768) -> tuple[str, int]:
+    """Safely read a file with error handling.
+
+    Returns the decoded text and the number of raw bytes read, so callers
+    reporting sizes never have to re-encode the text.
+    """
     try:
         file_path = _resolve_path(path)
         with file_path.open("rb") as f:
             f.seek(max(0, start_byte))
             data = f.read(max(1, max_bytes))
-        return data.decode("utf-8", errors="ignore")
+        return data.decode("utf-8", errors="ignore"), len(data)
     except Exception as e:
         raise ValueError(f"Cannot read {path}: {e}")
 
 
-def _resolve_path(path: str) -> Path:
-    """Resolve and validate a file path within the brain directory."""
+@lru_cache(maxsize=4096)
+def _resolve_within_brain(brain_dir: str, path: str) -> Path:
+    """Resolve a path against the brain directory and enforce containment.
+
+    Path.resolve stats every component, and tool calls re-read the same few
+    paths constantly, so the (brain_dir, path) -> resolved mapping is cached.
+    Rejections raise and are therefore never cached.
+    """
     if Path(path).is_absolute():
         resolved = Path(path).resolve()
     else:
-        resolved = (config.brain_dir / path).resolve()
+        resolved = (Path(brain_dir) / path).resolve()
 
-    # Security check: ensure path is within brain directory
-    if not str(resolved).startswith(str(config.brain_dir.resolve())):
+    # Security check: ensure path is within brain directory. Component-wise
+    # containment, so a sibling like /brain2 never passes for root /brain.
+    if not resolved.is_relative_to(_resolved_root(brain_dir)):
         raise ValueError("Path outside brain directory")
 
+    return resolved
+
+
+def _resolve_path(path: str) -> Path:
+    """Resolve and validate a file path within the brain directory."""
+    resolved = _resolve_within_brain(str(config.brain_dir), path)
+
+    # Existence stays outside the cache so deletions are noticed
     if not resolved.exists():
         raise ValueError("File not found")
 
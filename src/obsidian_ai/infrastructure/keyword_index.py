@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import pickle
+import re
+from functools import lru_cache
+from pathlib import Path
+from collections.abc import Iterable, Sequence
+
+from .config import config
+from .file_system import read_text_cached
+
+# Word runs in lowercased text; keywords made of these characters can be
+# answered from the token table without rereading any file
+_TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+INDEXABLE_KEYWORD = re.compile(r"[a-z0-9_]+\Z")
+
+
+def _tokenize(text_lower: str) -> dict[str, tuple[int, int]]:
+    """Map each token to its (occurrence count, first byte offset)."""
+    tokens: dict[str, tuple[int, int]] = {}
+    for match in _TOKEN_PATTERN.finditer(text_lower):
+        token = match.group()
+        entry = tokens.get(token)
+        tokens[token] = (entry[0] + 1, entry[1]) if entry is not None else (1, match.start())
+    return tokens
+
+
+class KeywordIndex:
+    """Persistent inverted index over the vault's word tokens.
+
+    Keyword queries become a scan of the vocabulary instead of the corpus:
+    a keyword's per-file count is the sum of token counts weighted by how
+    often the keyword appears inside each token, which matches a substring
+    scan exactly because word-character keywords cannot cross token
+    boundaries. Entries invalidate per file on mtime_ns, so a query after
+    an edit only re-tokenizes the changed files.
+    """
+
+    def __init__(self) -> None:
+        self._brain: str | None = None
+        self._entries: dict[str, tuple[int, dict[str, tuple[int, int]]]] = {}
+        self._postings: dict[str, list[tuple[str, int, int]]] | None = None
+        self._loaded = False
+
+    def refresh(self, brain_dir: Path, paths: Iterable[Path]) -> None:
+        """Bring the index up to date for the given files."""
+        if self._brain != str(brain_dir):
+            self._brain = str(brain_dir)
+            self._entries = {}
+            self._postings = None
+            self._loaded = False
+        if not self._loaded:
+            self._loaded = True
+            self._load()
+
+        changed = False
+        wanted: set[str] = set()
+        for path in paths:
+            try:
+                mtime = path.stat().st_mtime_ns
+            except OSError:
+                continue
+            key = str(path)
+            wanted.add(key)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == mtime:
+                continue
+            text = read_text_cached(path)
+            if text is None:
+                continue
+            self._entries[key] = (mtime, _tokenize(text.lower()))
+            changed = True
+
+        for key in [key for key in self._entries if key not in wanted]:
+            del self._entries[key]
+            changed = True
+
+        if changed:
+            self._postings = None
+            self._store()
+
+    def lookup(self, keywords: Sequence[str]) -> list[tuple[str, int, int]]:
+        """Score files against the keywords from postings alone.
+
+        Returns (path, score, first keyword offset) per matching file,
+        unordered; callers sort by whatever criterion they need.
+        """
+        if self._postings is None:
+            postings: dict[str, list[tuple[str, int, int]]] = {}
+            for path, (_mtime, tokens) in self._entries.items():
+                for token, (count, first) in tokens.items():
+                    postings.setdefault(token, []).append((path, count, first))
+            self._postings = postings
+
+        scores: dict[str, int] = {}
+        firsts: dict[str, int] = {}
+        for keyword in keywords:
+            for token, files in self._postings.items():
+                if keyword not in token:
+                    continue
+                per_token = token.count(keyword)
+                offset = token.index(keyword)
+                for path, count, first in files:
+                    scores[path] = scores.get(path, 0) + count * per_token
+                    pos = first + offset
+                    if pos < firsts.get(path, pos + 1):
+                        firsts[path] = pos
+
+        return [(path, score, firsts[path]) for path, score in scores.items()]
+
+    def _index_file(self) -> Path:
+        return config.cache_dir / "keyword_index_v1.pkl"
+
+    def _load(self) -> None:
+        if self._brain != str(config.brain_dir):
+            return
+        try:
+            data = pickle.loads(self._index_file().read_bytes())
+            if data.get("brain") == self._brain:
+                self._entries = data["entries"]
+        except Exception:
+            pass  # Missing or stale cache; refresh re-tokenizes from scratch
+
+    def _store(self) -> None:
+        # Only persist the configured vault's index; transient directories
+        # (tests, ad-hoc calls) stay in memory.
+        if self._brain != str(config.brain_dir):
+            return
+        try:
+            config.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._index_file().write_bytes(pickle.dumps({"brain": self._brain, "entries": self._entries}))
+        except Exception:
+            pass  # Persistence is best-effort; the in-memory index still works
+
+
+@lru_cache(maxsize=1)
+def get_keyword_index() -> KeywordIndex:
+    """Get the global keyword index instance."""
+    return KeywordIndex()
@@ -47,16 +47,21 @@ class ChatSession:
 
     def _handle_tool_calls(self, messages: list, message: Any, show_tools: bool) -> str:
         """Handle tool calls and get final response."""
+        # Parse each tool call's arguments once; display and dispatch share the dict
+        parsed_args = [self._parse_arguments(tool_call) for tool_call in message.tool_calls]
+
         if show_tools:
-            self._display_tool_calls(message.tool_calls)
+            self._display_tool_calls(message.tool_calls, parsed_args)
 
         # Add assistant message with tool calls
         messages.append({"role": "assistant", "content": message.content, "tool_calls": [tc.model_dump() for tc in message.tool_calls]})
 
         # Execute tools and add results
-        for tool_call in message.tool_calls:
+        for tool_call, args in zip(message.tool_calls, parsed_args):
             try:
-                result = dispatch_tool(tool_call.function.name, json.loads(tool_call.function.arguments))
+                if args is None:
+                    raise ValueError(f"Malformed tool arguments: {tool_call.function.arguments!r}")
+                result = dispatch_tool(tool_call.function.name, args)
 
                 messages.append({"role": "tool", "content": result, "tool_call_id": tool_call.id})
 
@@ -75,14 +80,21 @@ class ChatSession:
             logger.error(f"Error getting final response: {e}")
             return "I found some information but had trouble formulating a response."
 
-    def _display_tool_calls(self, tool_calls: list) -> None:
+    def _parse_arguments(self, tool_call: Any) -> dict[str, Any] | None:
+        """Decode a tool call's JSON arguments, or None if malformed."""
+        try:
+            args = json.loads(tool_call.function.arguments)
+            return args if isinstance(args, dict) else None
+        except Exception:
+            return None
+
+    def _display_tool_calls(self, tool_calls: list, parsed_args: list[dict[str, Any] | None]) -> None:
         """Display tool calls to user."""
-        for tool_call in tool_calls:
-            try:
-                args = json.loads(tool_call.function.arguments)
+        for tool_call, args in zip(tool_calls, parsed_args):
+            if args is not None:
                 args_str = ", ".join(f"{k}={v}" for k, v in args.items())
                 self.console.print(f"[yellow]🔧 Calling {tool_call.function.name}({args_str})[/yellow]")
-            except Exception:
+            else:
                 self.console.print(f"[yellow]🔧 Calling {tool_call.function.name}[/yellow]")
 
     def _display_tool_result(self, result: str) -> None:
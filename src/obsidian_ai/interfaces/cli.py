@@ -86,7 +86,7 @@ def search(query: str, max_results: int) -> None:
 def read(path: str, start: int, max_bytes: int) -> None:
     """Read a file from your notes."""
     try:
-        content = read_file_safe(path, start, max_bytes)
+        content, _ = read_file_safe(path, start, max_bytes)
         console.print(content)
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import json
 from typing import Any
+from collections.abc import Callable
 
 from ..core.search_engine import search_engine
-from ..core.research_agent import research_agent
+from ..core.research_agent import get_research_agent
 from ..infrastructure.file_system import read_file_safe
 from ..services.embedding_service import embedding_service
 
@@ -21,32 +22,35 @@ def semantic_search_tool(query: str, k: int | None = None) -> str:
 
 def deep_research_tool(topic: str, max_iterations: int | None = None) -> str:
     """Comprehensive research with wikilink following and iterative discovery."""
-    result = research_agent.conduct_research(topic, max_iterations or 4)
+    result = get_research_agent().conduct_research(topic, max_iterations or 4)
     return json.dumps(result, indent=2)
 
 
 def read_file_tool(path: str, start: int | None = None, max_bytes: int | None = None) -> str:
     """Read file content with optional byte range."""
     try:
-        content = read_file_safe(path, start or 0, max_bytes or 32768)
-        return json.dumps({"path": path, "content": content, "start": start or 0, "bytes": len(content.encode())})
+        content, nbytes = read_file_safe(path, start or 0, max_bytes or 32768)
+        return json.dumps({"path": path, "content": content, "start": start or 0, "bytes": nbytes})
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
+# Handler table: one hash lookup per tool call instead of a chain of
+# string comparisons
+_DISPATCH: dict[str, Callable[[dict[str, Any]], str]] = {
+    "search": lambda args: search_tool(args["query"], args.get("max_results")),
+    "semantic_search": lambda args: semantic_search_tool(args["query"], args.get("k")),
+    "deep_research": lambda args: deep_research_tool(args["topic"], args.get("max_iterations")),
+    "read_file": lambda args: read_file_tool(args["path"], args.get("start"), args.get("max_bytes")),
+}
+
+
 def dispatch_tool(name: str, args: dict[str, Any]) -> str:
     """Dispatch tool calls to appropriate handlers."""
-    match name:
-        case "search":
-            return search_tool(args["query"], args.get("max_results"))
-        case "semantic_search":
-            return semantic_search_tool(args["query"], args.get("k"))
-        case "deep_research":
-            return deep_research_tool(args["topic"], args.get("max_iterations"))
-        case "read_file":
-            return read_file_tool(args["path"], args.get("start"), args.get("max_bytes"))
-        case _:
-            return json.dumps({"error": f"Unknown tool: {name}"})
+    handler = _DISPATCH.get(name)
+    if handler is None:
+        return json.dumps({"error": f"Unknown tool: {name}"})
+    return handler(args)
 
 
 # OpenAI function definitions
@@ -5,6 +5,10 @@ from collections.abc import Iterable
 
 import numpy as np
 
+# 64-bit FNV-1a constants
+_FNV_BASIS = np.uint64(1469598103934665603)
+_FNV_PRIME = np.uint64(1099511628211)
+
 
 @dataclass
 class LocalVectorizer:
@@ -12,45 +16,79 @@ class LocalVectorizer:
     ngram_min: int = 3
     ngram_max: int = 5
 
-    def _hash(self, s: str) -> int:
-        # Simple 64-bit FNV-1a hashing
-        h = 1469598103934665603
-        for ch in s:
-            h ^= ord(ch)
-            h *= 1099511628211
-            h &= (1 << 64) - 1
-        return int(h % self.dim)
-
-    def indices(self, text: str) -> list[int]:
+    # FNV-1a is kept deliberately: the index is persisted across processes,
+    # so gram hashes must be seed-stable (built-in hash() is randomized per
+    # process), and the vectorized loop below amortizes its cost anyway.
+    def indices(self, text: str) -> np.ndarray:
         t = text.lower()
-        L = len(t)
-        idxs: list[int] = []
+        # Code points as a flat array; windows[:, j] is the j-th character of
+        # every n-gram, so FNV-1a runs vectorized across all grams at once
+        # instead of a Python loop per character.
+        codes = np.frombuffer(t.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+        L = len(codes)
+        parts: list[np.ndarray] = []
         for n in range(self.ngram_min, self.ngram_max + 1):
             if L < n:
                 continue
-            for i in range(L - n + 1):
-                gram = t[i : i + n]
-                idxs.append(self._hash(gram))
-        return idxs
+            windows = np.lib.stride_tricks.sliding_window_view(codes, n)
+            h = np.full(L - n + 1, _FNV_BASIS, dtype=np.uint64)
+            for j in range(n):
+                h ^= windows[:, j]
+                h = h * _FNV_PRIME  # uint64 arithmetic wraps mod 2**64
+            parts.append(h % np.uint64(self.dim))
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(parts).astype(np.int64)
 
     def tf(self, idxs: Iterable[int]) -> np.ndarray:
-        v = np.zeros(self.dim, dtype=np.float32)
-        for i in idxs:
-            v[i] += 1.0
-        return v
+        # One C-level histogram instead of a Python increment per index
+        arr = np.asarray(idxs, dtype=np.int64)
+        return np.bincount(arr, minlength=self.dim).astype(np.float32)
 
-    def fit_idf(self, chunks_indices: list[list[int]]) -> np.ndarray:
+    def fit_idf(self, chunks_indices: list[np.ndarray]) -> np.ndarray:
         df = np.zeros(self.dim, dtype=np.float32)
         for idxs in chunks_indices:
-            seen = set(idxs)
-            for i in seen:
-                df[i] += 1.0
+            df[np.unique(np.asarray(idxs, dtype=np.int64))] += 1.0
         N = float(max(1, len(chunks_indices)))
         idf = np.log((N + 1.0) / (df + 1.0)) + 1.0
-        return idf.astype(np.float32)  # type: ignore[no-any-return]
+        return idf.astype(np.float32)
+
+    def tfidf_matrix(self, chunks_indices: list[np.ndarray], idf: np.ndarray) -> np.ndarray:
+        """TF-IDF vectors for all chunks at once, rows L2-normalized.
+
+        One scattered accumulation plus one vectorized normalization replaces a
+        tfidf_norm call (and its allocations) per chunk.
+        """
+        X = np.zeros((len(chunks_indices), self.dim), dtype=np.float32)
+        if chunks_indices:
+            lengths = np.fromiter((len(idxs) for idxs in chunks_indices), dtype=np.int64, count=len(chunks_indices))
+            rows = np.repeat(np.arange(len(chunks_indices)), lengths)
+            cols = np.concatenate([np.asarray(idxs, dtype=np.int64) for idxs in chunks_indices])
+            np.add.at(X, (rows, cols), 1.0)
+        X *= idf
+        # einsum accumulates the row dot products directly, skipping the
+        # full squared matrix np.linalg.norm materializes
+        norms = np.sqrt(np.einsum("ij,ij->i", X, X))[:, None]
+        X /= np.where(norms == 0, 1.0, norms)
+        return X
 
-    def tfidf_norm(self, idxs: list[int], idf: np.ndarray) -> np.ndarray:
+    def tfidf_norm(self, idxs: np.ndarray, idf: np.ndarray) -> np.ndarray:
         v = self.tf(idxs)
         v *= idf
         n = np.linalg.norm(v)
         return v / n if n else v
+
+    def tfidf_norm_q8(self, idxs: np.ndarray, idf: np.ndarray) -> tuple[np.ndarray, float]:
+        """Int8-quantized TF-IDF vector plus its dequantization scale.
+
+        Rows are L2-normalized so every component lies in [-1, 1] and maps
+        onto the int8 range with negligible retrieval-quality loss, at a
+        quarter of the float32 memory footprint.
+        """
+        v = self.tfidf_norm(idxs, idf)
+        return np.round(v * 127.0).astype(np.int8), 1.0 / 127.0
+
+    def tfidf_matrix_q8(self, chunks_indices: list[np.ndarray], idf: np.ndarray) -> tuple[np.ndarray, float]:
+        """Int8-quantized TF-IDF matrix plus the shared dequantization scale."""
+        X = self.tfidf_matrix(chunks_indices, idf)
+        return np.round(X * 127.0).astype(np.int8), 1.0 / 127.0
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+import string
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -12,27 +14,56 @@ class PromptTemplate:
     name: str
     template: str
     variables: list[str]
+    _parts: list[tuple[str, str | None, str | None, str | None]] = field(init=False, repr=False)
+    _required: frozenset[str] = field(init=False, repr=False)
+    _simple: bool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Parse the template once at construction; render only joins the
+        # parsed segments instead of re-parsing the string every call
+        self._parts = list(string.Formatter().parse(self.template))
+        self._required = frozenset(self.variables)
+        self._simple = all(not spec and conv is None for _, name, spec, conv in self._parts if name is not None)
 
     def render(self, **kwargs: str) -> str:
         """Render the template with provided variables."""
-        missing = [var for var in self.variables if var not in kwargs]
-        if missing:
+        # One C-level subset check in the common all-present case; the
+        # declaration-ordered list is only rebuilt to raise
+        if not self._required <= kwargs.keys():
+            missing = [var for var in self.variables if var not in kwargs]
             raise ValueError(f"Missing template variables: {missing}")
 
-        return self.template.format(**kwargs)
+        if not self._simple:  # format specs or conversions: let str.format handle them
+            return self.template.format(**kwargs)
+        return "".join(literal + (str(kwargs[name]) if name else "") for literal, name, _, _ in self._parts)
 
 
 class PromptManager:
     """Manages and loads prompt templates from files or environment."""
 
+    _RENDER_CACHE_SIZE = 128
+
     def __init__(self, prompts_dir: Path | None = None):
         self.prompts_dir = prompts_dir or Path(__file__).parent
         self._templates: dict[str, PromptTemplate] = {}
+        # Rendered-output LRU; the research loop re-renders identical
+        # prompts with the same context fragments
+        self._render_cache: OrderedDict[tuple, str] = OrderedDict()
 
     def load_template(self, name: str, template: str, variables: list[str]) -> PromptTemplate:
         """Load a template and store it."""
+        # Reloading identical content is a no-op, so callers that re-register
+        # their templates per instantiation skip the parse and keep their
+        # cached renders
+        existing = self._templates.get(name)
+        if existing is not None and existing.template == template and existing.variables == variables:
+            return existing
+
         prompt_template = PromptTemplate(name, template, variables)
         self._templates[name] = prompt_template
+        # Reloading a template invalidates its cached renders
+        for key in [key for key in self._render_cache if key[0] == name]:
+            del self._render_cache[key]
         return prompt_template
 
     def get_template(self, name: str) -> PromptTemplate:
@@ -42,8 +73,22 @@ class PromptManager:
         return self._templates[name]
 
     def render(self, name: str, **kwargs: str) -> str:
-        """Render a template with variables."""
-        return self.get_template(name).render(**kwargs)
+        """Render a template with variables, reusing recent identical renders."""
+        try:
+            key = (name, tuple(sorted(kwargs.items())))
+        except TypeError:
+            return self.get_template(name).render(**kwargs)  # non-hashable value
+
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            self._render_cache.move_to_end(key)
+            return cached
+
+        rendered = self.get_template(name).render(**kwargs)
+        self._render_cache[key] = rendered
+        if len(self._render_cache) > self._RENDER_CACHE_SIZE:
+            self._render_cache.popitem(last=False)
+        return rendered
 
     def load_from_env(self, name: str, default: str, variables: list[str]) -> PromptTemplate:
         """Load template from environment variable with fallback."""
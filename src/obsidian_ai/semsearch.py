@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import pickle
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 
 import numpy as np
 from loguru import logger
 
 from .infrastructure.config import config
-from .infrastructure.file_system import iter_text_files
+from .infrastructure.file_system import iter_text_files, read_all_text
 
 # Constants
 MAX_FILE_BYTES = 1_000_000  # 1MB file size limit
@@ -19,19 +24,36 @@ def _ensure_cache_dir() -> None:
     config.cache_dir.mkdir(parents=True, exist_ok=True)
 
 
-def _signature() -> str:
-    items = []
-    for p in iter_text_files(config.brain_dir, config.ignore_patterns):
-        try:
-            st = p.stat()
-        except Exception:
-            continue
-        items.append((str(p), int(st.st_mtime_ns), int(st.st_size)))
+def _stat_one(p: Path) -> tuple[str, int, int] | None:
+    try:
+        st = p.stat()
+    except Exception:
+        return None
+    return (str(p), int(st.st_mtime_ns), int(st.st_size))
+
+
+def _stat_entries() -> list[tuple[str, int, int]]:
+    """Sorted (path, mtime_ns, size) for every note, stat-ed once.
+
+    stat releases the GIL, so fanning the per-file calls across threads
+    overlaps the syscalls that dominate this walk. The result feeds both the
+    signature and the build loop, which reuses the sizes instead of
+    re-stat-ing.
+    """
+    paths = list(iter_text_files(config.brain_dir, config.ignore_patterns))
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        items = [item for item in executor.map(_stat_one, paths, chunksize=64) if item is not None]
     items.sort()
-    total = 0
-    for _, mt, sz in items:
-        total ^= (mt & 0xFFFFFFFF) ^ (sz & 0xFFFFFFFF)
-    return str(total)
+    return items
+
+
+def _signature(entries: list[tuple[str, int, int]]) -> str:
+    # Collision-safe digest over the sorted entries; the old XOR fold was
+    # blind to swapped mtimes or compensating size changes
+    h = hashlib.blake2b(digest_size=16)
+    for path, mt, sz in entries:
+        h.update(f"{path}\0{mt}\0{sz}\n".encode())
+    return h.hexdigest()
 
 
 @dataclass
@@ -41,102 +63,222 @@ class ChunkRec:
     preview: str
 
 
+# Per-file vectorization cache: (mtime_ns, size) -> the file's chunk starts,
+# previews, and ngram indices. Editing one note invalidates the whole index
+# signature, but only the edited file needs rereading and re-vectorizing;
+# idf and the quantized matrix are global and always recomputed.
+_CHUNK_CACHE_PARAMS = ("v1", 512, 3, 5, 1200)
+
+
+def _load_chunk_cache() -> dict[str, tuple[int, int, list[tuple[int, str, np.ndarray]]]]:
+    try:
+        data = pickle.loads((config.cache_dir / "chunks_v1.pkl").read_bytes())
+        if data.get("params") == _CHUNK_CACHE_PARAMS:
+            files = data["files"]
+            if isinstance(files, dict):
+                return files
+    except Exception:
+        pass  # Missing or stale cache; the build re-vectorizes from scratch
+    return {}
+
+
+def _store_chunk_cache(files: dict[str, tuple[int, int, list[tuple[int, str, np.ndarray]]]]) -> None:
+    try:
+        (config.cache_dir / "chunks_v1.pkl").write_bytes(pickle.dumps({"params": _CHUNK_CACHE_PARAMS, "files": files}))
+    except Exception:
+        pass  # Persistence is best-effort; the index itself was still built
+
+
+# Burst cache: queries arriving within the TTL reuse the in-process index
+# without re-stat-ing every file for the signature check.
+_INDEX_TTL_SECONDS = 2.0
+_index_cache: tuple[float, str, tuple[np.ndarray, np.ndarray, np.ndarray, list[ChunkRec]]] | None = None
+
+# Shared query-side vectorizer; construction is cheap but there is no reason
+# to repeat it per query.
+_query_vec = LocalVectorizer(dim=512, ngram_min=3, ngram_max=5)
+
+
 def _chunk_text(text: str, max_len: int = 1000) -> list[tuple[int, str]]:
-    paras = [p.strip() for p in text.splitlines() if p.strip()]
     chunks: list[tuple[int, str]] = []
     buf: list[str] = []
+    buf_len = 0  # running length of "\n".join(buf), kept incrementally
     start = 0
     pos = 0
-    for para in paras:
-        if sum(len(x) for x in buf) + len(para) + len(buf) > max_len and buf:
-            chunk = "\n".join(buf)
-            chunks.append((start, chunk))
+    for para in text.splitlines():
+        para = para.strip()
+        if not para:
+            continue
+        if buf and buf_len + len(para) > max_len:
+            chunks.append((start, "\n".join(buf)))
             buf = []
+            buf_len = 0
             start = pos
         buf.append(para)
+        buf_len += len(para) + 1
         pos += len(para) + 1
     if buf:
         chunks.append((start, "\n".join(buf)))
     return chunks or [(0, text[:max_len])]
 
 
-def build_or_load_index() -> tuple[np.ndarray, np.ndarray, list[ChunkRec]]:
+def build_or_load_index() -> tuple[np.ndarray, np.ndarray, np.ndarray, list[ChunkRec]]:
+    global _index_cache
+    now = time.time()
+    if _index_cache is not None and now - _index_cache[0] < _INDEX_TTL_SECONDS:
+        return _index_cache[2]
+
     _ensure_cache_dir()
-    index_npz = config.cache_dir / "index_v1.npz"
-    meta_json = config.cache_dir / "meta_v1.json"
-    sig = _signature()
-    if index_npz.exists() and meta_json.exists():
+    # Uncompressed per-array files: the matrix memory-maps straight from the
+    # page cache, so loading costs only the pages the matmul touches instead
+    # of a full decompress-and-copy per query.
+    matrix_npy = config.cache_dir / "matrix_v3.npy"
+    bits_npy = config.cache_dir / "bits_v3.npy"
+    idf_npy = config.cache_dir / "idf_v3.npy"
+    meta_json = config.cache_dir / "meta_v3.json"
+    entries = _stat_entries()
+    sig = _signature(entries)
+    if _index_cache is not None and _index_cache[1] == sig:
+        _index_cache = (now, sig, _index_cache[2])
+        return _index_cache[2]
+
+    if matrix_npy.exists() and bits_npy.exists() and idf_npy.exists() and meta_json.exists():
         try:
             meta = json.loads(meta_json.read_text())
             if meta.get("signature") == sig:
-                data = np.load(index_npz, allow_pickle=True)
-                matrix = data["matrix"]
-                idf = data["idf"]
-                paths = data["paths"].tolist()
-                starts = data["starts"].tolist()
-                previews = data["previews"].tolist()
-                recs = [ChunkRec(path=p, start=s, preview=pr) for p, s, pr in zip(paths, starts, previews)]
-                return matrix, idf, recs
+                matrix = np.load(matrix_npy, mmap_mode="r")
+                bits = np.load(bits_npy, mmap_mode="r")
+                idf = np.load(idf_npy)
+                recs = [ChunkRec(path=p, start=s, preview=pr) for p, s, pr in zip(meta["paths"], meta["starts"], meta["previews"])]
+                _index_cache = (now, sig, (matrix, bits, idf, recs))
+                return _index_cache[2]
         except Exception:
             logger.warning("Embedding cache invalid; rebuilding")
 
     vec = LocalVectorizer(dim=512, ngram_min=3, ngram_max=5)
-    chunk_indices: list[list[int]] = []
+    chunk_indices: list[np.ndarray] = []
     all_recs: list[ChunkRec] = []
-    for p in iter_text_files(config.brain_dir, config.ignore_patterns):
-        try:
-            if p.stat().st_size > MAX_FILE_BYTES:
-                continue
-            t = p.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
+
+    # Split files into cache hits and the ones that actually changed; sizes
+    # and mtimes come from the signature stats above, no second stat per file
+    old_cache = _load_chunk_cache()
+    new_cache: dict[str, tuple[int, int, list[tuple[int, str, np.ndarray]]]] = {}
+    stale: list[tuple[Path, int, int]] = []
+    for path, mt, size in entries:
+        if size > MAX_FILE_BYTES:
             continue
+        cached = old_cache.get(path)
+        if cached is not None and cached[0] == mt and cached[1] == size:
+            new_cache[path] = cached
+        else:
+            stale.append((Path(path), mt, size))
+
+    # Overlapped reads: the thread pool hides per-file open/read latency.
+    # Identical chunk texts (templates, repeated backlink sections) are
+    # vectorized once and share the same indices array.
+    stat_by_path = {str(p): (mt, size) for p, mt, size in stale}
+    seen_chunks: dict[str, np.ndarray] = {}
+    for p, t in read_all_text(p for p, _, _ in stale):
+        chunks = []
         for start, chunk in _chunk_text(t, max_len=1200):
-            idxs = vec.indices(chunk)
+            idxs = seen_chunks.get(chunk)
+            if idxs is None:
+                idxs = vec.indices(chunk)
+                seen_chunks[chunk] = idxs
+            chunks.append((start, chunk[:240], idxs))
+        mt, size = stat_by_path[str(p)]
+        new_cache[str(p)] = (mt, size, chunks)
+
+    # Assemble in the sorted entry order so row order is deterministic
+    for path, _, size in entries:
+        cached = new_cache.get(path)
+        if cached is None:
+            continue
+        for start, preview, idxs in cached[2]:
             chunk_indices.append(idxs)
-            all_recs.append(ChunkRec(path=str(p), start=start, preview=chunk[:240]))
+            all_recs.append(ChunkRec(path=path, start=start, preview=preview))
+
+    _store_chunk_cache(new_cache)
 
     if not chunk_indices:
-        matrix = np.zeros((0, vec.dim), dtype=np.float32)
+        mtx = np.zeros((0, vec.dim), dtype=np.int8)
         idf = np.ones(vec.dim, dtype=np.float32)
-        meta_json.write_text(json.dumps({"signature": sig, "built_at": time.time()}))
-        np.savez_compressed(index_npz, matrix=matrix, idf=idf, paths=[], starts=[], previews=[])
-        return matrix, idf, all_recs
+    else:
+        idf = vec.fit_idf(chunk_indices)
+        # Int8 rows: 4x smaller on disk and 4x less memory traffic per search scan
+        mtx, _ = vec.tfidf_matrix_q8(chunk_indices, idf)
+
+    # Sign-bit planes: 512 dims pack into 64 bytes per row, used as a
+    # Hamming-distance candidate filter before the int8 rerank
+    bits = np.packbits(mtx > 0, axis=1)
 
-    idf = vec.fit_idf(chunk_indices)
-    mtx = np.zeros((len(chunk_indices), vec.dim), dtype=np.float32)
-    for i, idxs in enumerate(chunk_indices):
-        mtx[i, :] = vec.tfidf_norm(idxs, idf)
+    np.save(matrix_npy, mtx)
+    np.save(bits_npy, bits)
+    np.save(idf_npy, idf)
+    meta = {
+        "signature": sig,
+        "built_at": time.time(),
+        "paths": [r.path for r in all_recs],
+        "starts": [r.start for r in all_recs],
+        "previews": [r.preview for r in all_recs],
+    }
+    meta_json.write_text(json.dumps(meta))
+    _index_cache = (now, sig, (mtx, bits, idf, all_recs))
+    return _index_cache[2]
 
-    paths = np.array([r.path for r in all_recs], dtype=object)
-    starts = np.array([r.start for r in all_recs], dtype=object)
-    previews = np.array([r.preview for r in all_recs], dtype=object)
-    np.savez_compressed(index_npz, matrix=mtx, idf=idf, paths=paths, starts=starts, previews=previews)
-    meta_json.write_text(json.dumps({"signature": sig, "built_at": time.time()}))
-    return mtx, idf, all_recs
 
+@lru_cache(maxsize=256)
+def _cached_query_vector(query: str, signature: str) -> tuple[np.ndarray, float]:
+    """Quantized query vector, cached per (query, corpus signature).
 
-def semantic_search(query: str, k: int = 10) -> str:
-    matrix, idf, recs = build_or_load_index()
-    if matrix.shape[0] == 0:
-        return json.dumps({"query": query, "results": []})
-    vec = LocalVectorizer(dim=matrix.shape[1], ngram_min=3, ngram_max=5)
-    qidx = vec.indices(query)
-    qvec = vec.tfidf_norm(qidx, idf)
-    sims = matrix @ qvec
+    Agents reissue the same query across research iterations; the signature
+    key ties cached vectors to the idf they were built against.
+    """
+    matrix, _, idf, _ = _index_cache[2]  # type: ignore[index]  # set by build_or_load_index
+    vec = _query_vec if matrix.shape[1] == _query_vec.dim else LocalVectorizer(dim=matrix.shape[1], ngram_min=3, ngram_max=5)
+    return vec.tfidf_norm_q8(vec.indices(query), idf)
+
+
+def semantic_search_dict(query: str, k: int = 10) -> dict:
+    matrix, bits, _, recs = build_or_load_index()
+    n = matrix.shape[0]
+    if n == 0:
+        return {"query": query, "results": []}
+    qvec, scale = _cached_query_vector(query, _index_cache[1] if _index_cache is not None else "")
     topk = max(1, min(int(k or 10), 25))
-    order = np.argsort(-sims)[:topk]
+
+    # Two-stage retrieval: a Hamming scan over the packed sign bits picks a
+    # candidate pool (reading 64 bytes per row instead of 512), then the int8
+    # rows rerank only those candidates.
+    n_candidates = topk * 4
+    if n_candidates < n:
+        qbits = np.packbits(qvec > 0)
+        hamming = np.unpackbits(np.bitwise_xor(bits, qbits[None, :]), axis=1).sum(axis=1)
+        candidates = np.argpartition(hamming, n_candidates - 1)[:n_candidates]
+    else:
+        candidates = np.arange(n)
+
+    sims = (np.asarray(matrix[candidates]).astype(np.int32) @ qvec.astype(np.int32)).astype(np.float32) * (scale * scale)
+    # Select-then-sort: partition out the top-k in O(n), sort only those
+    kk = min(topk, sims.shape[0])
+    part = np.argpartition(-sims, kk - 1)[:kk]
+    order = part[np.argsort(-sims[part])]
     out = []
-    for i in order:
-        i = int(i)
+    for j in order:
+        i = int(candidates[j])
         out.append(
             {
                 "path": recs[i].path,
                 "start": int(recs[i].start),
-                "score": round(float(sims[i]), 4),
+                "score": round(float(sims[int(j)]), 4),
                 "preview": recs[i].preview,
             }
         )
-    return json.dumps({"query": query, "results": out})
+    return {"query": query, "results": out}
+
+
+def semantic_search(query: str, k: int = 10) -> str:
+    return json.dumps(semantic_search_dict(query, k))
 
 
 def semantic_tool_spec() -> dict:
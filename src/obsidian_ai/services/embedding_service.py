@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from typing import Any
 
-from ..semsearch import semantic_search as _semantic_search
+from ..semsearch import semantic_search_dict as _semantic_search_dict
 
 
 class EmbeddingService:
@@ -15,8 +15,7 @@ class EmbeddingService:
     def semantic_search(self, query: str, k: int = 10) -> dict[str, Any]:
         """Perform semantic search and return structured results."""
         try:
-            result_json = _semantic_search(query, k)
-            return json.loads(result_json)  # type: ignore[no-any-return]
+            return _semantic_search_dict(query, k)
         except Exception as e:
             return {"query": query, "results": [], "error": str(e)}
 
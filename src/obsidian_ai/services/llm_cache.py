@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from ..infrastructure.config import config
+from ..local_embed import LocalVectorizer
+
+# Cosine similarity a stored prompt must clear for a semantic-tier hit.
+# Research prompts are mostly fixed template text, and under the char-ngram
+# TF embedding two renderings of the same template with unrelated topics
+# already score ~0.99; genuine near-duplicates score ~0.9996. The threshold
+# sits between those bands so a cached plan for one topic is never served
+# for another.
+SEMANTIC_THRESHOLD = 0.999
+
+
+class LLMCache:
+    """Two-tier cache for LLM completions.
+
+    Responses are keyed exactly by SHA-256 of (model, prompt), with a
+    fallback tier that serves near-duplicate prompts whose local embedding
+    cosine similarity clears the threshold. Entries persist in the vault
+    cache directory; including the model name in the key invalidates the
+    cache when the configured model changes.
+    """
+
+    def __init__(self, threshold: float = SEMANTIC_THRESHOLD) -> None:
+        self.threshold = threshold
+        self._vectorizer = LocalVectorizer()
+        self._entries: dict[str, dict[str, str]] = {}
+        self._keys: list[str] = []
+        self._matrix: np.ndarray | None = None
+        self._loaded = False
+        # Callers hit the cache from concurrent analysis threads; the lock
+        # keeps _keys and the embedding matrix rows aligned under
+        # interleaved puts and makes first-use loading atomic
+        self._lock = threading.Lock()
+
+    def get(self, prompt: str) -> str | None:
+        """Return a cached response for this prompt, or None on a miss."""
+        with self._lock:
+            self._load()
+
+            entry = self._entries.get(self._key(prompt))
+            if entry is not None:
+                return entry["response"]
+
+            if self._matrix is None:
+                return None
+
+            sims = self._matrix @ self._embed(prompt)
+            best = int(np.argmax(sims))
+            if float(sims[best]) >= self.threshold:
+                return self._entries[self._keys[best]]["response"]
+            return None
+
+    def put(self, prompt: str, response: str) -> None:
+        """Store a response and persist the cache to disk."""
+        with self._lock:
+            self._load()
+
+            key = self._key(prompt)
+            if key in self._entries:
+                return
+
+            self._entries[key] = {"prompt": prompt, "response": response}
+            self._keys.append(key)
+            vec = self._embed(prompt)
+            self._matrix = vec[None, :] if self._matrix is None else np.vstack([self._matrix, vec])
+
+            try:
+                config.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._cache_file().write_text(json.dumps(self._entries))
+            except Exception:
+                pass  # A read-only cache dir only costs persistence, not correctness
+
+    def _cache_file(self) -> Path:
+        return config.cache_dir / "llm_cache_v1.json"
+
+    def _key(self, prompt: str) -> str:
+        return hashlib.sha256(f"{config.model}\x00{prompt}".encode()).hexdigest()
+
+    def _embed(self, prompt: str) -> np.ndarray:
+        v = self._vectorizer.tf(self._vectorizer.indices(prompt))
+        n = np.linalg.norm(v)
+        return v / n if n else v
+
+    def _load(self) -> None:
+        # Caller holds self._lock
+        if self._loaded:
+            return
+
+        try:
+            data = json.loads(self._cache_file().read_text())
+        except Exception:
+            self._loaded = True
+            return
+
+        self._entries = {k: v for k, v in data.items() if isinstance(v, dict) and "prompt" in v and "response" in v}
+        self._keys = list(self._entries)
+        if self._keys:
+            self._matrix = np.stack([self._embed(self._entries[k]["prompt"]) for k in self._keys])
+        self._loaded = True
+
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> LLMCache:
+    """Get the global LLM cache instance."""
+    return LLMCache()
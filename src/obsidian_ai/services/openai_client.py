@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from typing import Any
 
+import httpx2
 from loguru import logger
 from openai import OpenAI
 from openai.types.chat import ChatCompletion
 
 from ..infrastructure.config import config
+from .llm_cache import get_llm_cache
 
 
 class OpenAIError(Exception):
@@ -19,7 +21,14 @@ class OpenAIClient:
     """Wrapper for OpenAI client with error handling and retries."""
 
     def __init__(self) -> None:
-        self.client = OpenAI()
+        # One tuned connection pool for every request: generous keepalives so
+        # bursts of small completions reuse connections instead of re-paying
+        # TCP/TLS setup per call.
+        self._http = httpx2.Client(
+            limits=httpx2.Limits(max_connections=32, max_keepalive_connections=32),
+            timeout=httpx2.Timeout(60.0),
+        )
+        self.client = OpenAI(http_client=self._http)
 
     def chat_completion(
         self, messages: list[dict[str, str]], tools: list[dict] | None = None, max_tokens: int = 2000, temperature: float = 0.1
@@ -33,11 +42,20 @@ class OpenAIClient:
             logger.error(f"OpenAI API error: {e}")
             raise OpenAIError(f"Failed to get OpenAI response: {e}") from e
 
-    def simple_completion(self, prompt: str, max_tokens: int = 500) -> str:
-        """Get a simple text completion."""
+    def simple_completion(self, prompt: str, max_tokens: int = 500, use_cache: bool = False) -> str:
+        """Get a simple text completion, optionally served from the LLM cache."""
+        cache = get_llm_cache() if use_cache else None
+        if cache is not None:
+            cached = cache.get(prompt)
+            if cached is not None:
+                return cached
+
         try:
             response = self.chat_completion(messages=[{"role": "user", "content": prompt}], max_tokens=max_tokens)
-            return response.choices[0].message.content or ""
+            content = response.choices[0].message.content or ""
+            if cache is not None and content:
+                cache.put(prompt, content)
+            return content
         except Exception as e:
             logger.error(f"Error in simple completion: {e}")
             return f"Error: Could not process request - {e}"
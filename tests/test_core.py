@@ -27,11 +27,12 @@ class TestWikilinkParser:
         assert len(links) == 0
 
     def test_extract_wikilinks_nested_brackets(self):
+        # Inner brackets are not valid in Obsidian link targets; the linear
+        # pattern treats them as malformed rather than backtracking
         text = "This has [[nested [brackets] inside]] a link."
 
         links = WikiLinkParser.extract_wikilinks(text)
-        assert len(links) == 1
-        assert links[0].target == "nested [brackets] inside"
+        assert len(links) == 0
 
     def test_extract_wikilinks_multiline(self):
         text = """
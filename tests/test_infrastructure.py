@@ -4,7 +4,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 from obsidian_ai.infrastructure.config import Config
-from obsidian_ai.infrastructure.file_system import iter_text_files, read_file_safe, _resolve_path
+from obsidian_ai.infrastructure.file_system import iter_text_files, read_file_safe, read_file_cached, read_text_cached, _resolve_path
 import string
 
 
@@ -94,6 +94,29 @@ class TestFileSystem:
         assert "ignore.md" not in file_names
         assert "config.md" not in file_names
 
+    def test_iter_text_files_never_enters_ignored_dirs(self, temp_brain):
+        import obsidian_ai.infrastructure.file_index as file_index
+
+        git_dir = temp_brain / ".git"
+        git_dir.mkdir()
+        (git_dir / "objects").mkdir()
+        (git_dir / "objects" / "pack.md").write_text("not a note")
+
+        scanned: list[str] = []
+        real_scandir = os.scandir
+
+        def tracking_scandir(path):
+            scanned.append(str(path))
+            return real_scandir(path)
+
+        with patch.object(file_index.os, "scandir", tracking_scandir):
+            files = list(iter_text_files(temp_brain, ignore_patterns=[".git"]))
+
+        # Pruned subtrees are never opened, not just filtered afterwards
+        assert scanned
+        assert not any(".git" in p for p in scanned)
+        assert not any(".git" in str(f) for f in files)
+
     def test_read_file_safe_basic(self, temp_brain):
         test_file = temp_brain / "test.md"
         test_content = "# Test\nThis is test content."
@@ -102,8 +125,9 @@ class TestFileSystem:
         with patch("obsidian_ai.infrastructure.file_system.config") as mock_config:
             mock_config.brain_dir = temp_brain
 
-            content = read_file_safe("test.md")
+            content, nbytes = read_file_safe("test.md")
             assert content == test_content
+            assert nbytes == len(test_content.encode())
 
     def test_read_file_safe_with_range(self, temp_brain):
         test_file = temp_brain / "test.md"
@@ -113,8 +137,9 @@ class TestFileSystem:
         with patch("obsidian_ai.infrastructure.file_system.config") as mock_config:
             mock_config.brain_dir = temp_brain
 
-            content = read_file_safe("test.md", start_byte=10, max_bytes=20)
+            content, nbytes = read_file_safe("test.md", start_byte=10, max_bytes=20)
             assert content == test_content[10:30]
+            assert nbytes == 20
 
     def test_read_file_safe_absolute_path(self, temp_brain):
         test_file = temp_brain / "test.md"
@@ -124,7 +149,7 @@ class TestFileSystem:
         with patch("obsidian_ai.infrastructure.file_system.config") as mock_config:
             mock_config.brain_dir = temp_brain
 
-            content = read_file_safe(str(test_file))
+            content, _ = read_file_safe(str(test_file))
             assert content == test_content
 
     def test_read_file_safe_not_found(self, temp_brain):
@@ -134,6 +159,60 @@ class TestFileSystem:
             with pytest.raises(ValueError, match="File not found"):
                 read_file_safe("nonexistent.md")
 
+    def test_file_index_cached_listing(self, temp_brain):
+        from obsidian_ai.infrastructure.file_index import FileIndex
+
+        index = FileIndex()
+        first = index.list_files(temp_brain, [])
+        second = index.list_files(temp_brain, [])
+
+        # Unchanged vault is served from the cached listing
+        assert second is first
+
+    def test_file_index_picks_up_new_files(self, temp_brain):
+        from obsidian_ai.infrastructure.file_index import FileIndex
+
+        index = FileIndex()
+        before = index.list_files(temp_brain, [])
+
+        (temp_brain / "brand_new.md").write_text("# New note")
+        os.utime(temp_brain, ns=(0, temp_brain.stat().st_mtime_ns + 1_000_000))
+
+        after = index.list_files(temp_brain, [])
+        assert len(after) == len(before) + 1
+        assert any(f.name == "brand_new.md" for f in after)
+
+    def test_read_text_cached(self, temp_brain):
+        test_file = temp_brain / "cached.md"
+        test_file.write_text("cached content")
+
+        assert read_text_cached(test_file) == "cached content"
+        # Second read of the unchanged file is served from the cache
+        assert read_text_cached(test_file) == "cached content"
+
+    def test_read_text_cached_invalidated_on_change(self, temp_brain):
+        test_file = temp_brain / "cached.md"
+        test_file.write_text("old content")
+        read_text_cached(test_file)
+
+        test_file.write_text("new content")
+        os.utime(test_file, ns=(0, test_file.stat().st_mtime_ns + 1_000_000))
+
+        assert read_text_cached(test_file) == "new content"
+
+    def test_read_text_cached_missing_file(self, temp_brain):
+        assert read_text_cached(temp_brain / "missing.md") is None
+
+    def test_read_file_cached(self, temp_brain):
+        test_file = temp_brain / "cached.md"
+        test_file.write_text("# Cached\nBody text.")
+
+        with patch("obsidian_ai.infrastructure.file_system.config") as mock_config:
+            mock_config.brain_dir = temp_brain
+
+            assert read_file_cached("cached.md") == "# Cached\nBody text."
+            assert read_file_cached("cached.md", max_chars=8) == "# Cached"
+
     def test_resolve_path_security(self, temp_brain):
         with patch("obsidian_ai.infrastructure.file_system.config") as mock_config:
             mock_config.brain_dir = temp_brain
@@ -183,7 +262,7 @@ class TestFileSystem:
             mock_config.brain_dir = temp_brain
 
             # Should handle encoding errors gracefully
-            content = read_file_safe("binary.md")
+            content, _ = read_file_safe("binary.md")
             assert isinstance(content, str)  # Should return string, not raise error
 
     def test_read_file_safe_large_file(self, temp_brain):
@@ -195,9 +274,9 @@ class TestFileSystem:
             mock_config.brain_dir = temp_brain
 
             # Read with default limit
-            content = read_file_safe("large.md")
+            content, _ = read_file_safe("large.md")
             assert len(content) <= 32768  # Default max_bytes
 
             # Read with custom limit
-            content = read_file_safe("large.md", max_bytes=1000)
+            content, _ = read_file_safe("large.md", max_bytes=1000)
             assert len(content) <= 1000
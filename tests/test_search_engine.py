@@ -123,6 +123,23 @@ class TestKeywordSearch:
         if ai_project_results:
             assert ai_project_results[0].score >= 2  # Should match multiple keywords
 
+    def test_keyword_index_reflects_file_changes(self, mock_brain, mock_config):
+        import os
+
+        with patch("obsidian_ai.core.search_engine.config", mock_config):
+            search = KeywordSearch()
+            assert not search.search("zephyr", max_results=10)
+
+            note = mock_brain / "people.md"
+            note.write_text(note.read_text() + "\nA note about the zephyr project.")
+            os.utime(note, ns=(0, note.stat().st_mtime_ns + 1_000_000))
+
+            results = search.search("zephyr", max_results=10)
+
+        # The inverted index re-tokenizes edited files instead of serving stale postings
+        assert len(results) == 1
+        assert "zephyr" in results[0].text
+
     def test_short_keywords_ignored(self, mock_config):
         with patch("obsidian_ai.core.search_engine.config", mock_config):
             search = KeywordSearch()
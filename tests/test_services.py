@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
     from obsidian_ai.services.openai_client import OpenAIClient, OpenAIError
     from obsidian_ai.services.embedding_service import EmbeddingService
+    from obsidian_ai.services.llm_cache import LLMCache
 
 
 class TestOpenAIClient:
@@ -209,3 +210,62 @@ class TestEmbeddingService:
 
         assert result["query"] == special_query
         assert "results" in result
+
+
+class TestLLMCache:
+    @pytest.fixture
+    def cache_config(self, tmp_path):
+        with patch("obsidian_ai.services.llm_cache.config") as mock_cfg:
+            mock_cfg.cache_dir = tmp_path / "cache"
+            mock_cfg.model = "gpt-4o"
+            yield mock_cfg
+
+    def test_exact_hit(self, cache_config):
+        cache = LLMCache()
+        cache.put("What is machine learning?", "A field of AI.")
+
+        assert cache.get("What is machine learning?") == "A field of AI."
+
+    def test_miss(self, cache_config):
+        cache = LLMCache()
+        cache.put("What is machine learning?", "A field of AI.")
+
+        assert cache.get("Completely unrelated question about cooking") is None
+
+    def test_semantic_hit_on_near_duplicate(self, cache_config):
+        cache = LLMCache(threshold=0.8)
+        prompt = "Summarize the research findings about neural networks in detail"
+        cache.put(prompt, "Summary text.")
+
+        near_duplicate = "Summarize the research findings about neural networks in details"
+        assert cache.get(near_duplicate) == "Summary text."
+
+    def test_no_cross_topic_hit_on_templated_prompts(self, cache_config):
+        from obsidian_ai.prompts.research import ResearchPrompts
+
+        # Two renderings of the same research template differ only in topic;
+        # the shared boilerplate must not let one topic's plan answer another
+        prompts = ResearchPrompts()
+        quantum = prompts.get_research_reasoning_prompt(
+            original_topic="quantum computing", current_focus="quantum gates", previous_context="", discovered_context=""
+        )
+        baking = prompts.get_research_reasoning_prompt(
+            original_topic="sourdough baking", current_focus="starter hydration", previous_context="", discovered_context=""
+        )
+
+        cache = LLMCache()
+        cache.put(quantum, "ACTION: search\nQUERY: quantum gates")
+
+        assert cache.get(baking) is None
+
+    def test_persists_across_instances(self, cache_config):
+        first = LLMCache()
+        first.put("persistent prompt", "persistent response")
+
+        second = LLMCache()
+        assert second.get("persistent prompt") == "persistent response"
+
+    def test_empty_cache(self, cache_config):
+        cache = LLMCache()
+
+        assert cache.get("anything") is None